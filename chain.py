@@ -14,20 +14,27 @@ Several runner functions demonstrate different execution modes, including
 "abridged" modes that skip repetitive expansions.
 """
 
-import re
 import sys
 import select
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 
-@dataclass
-class RewriteMatch:
-    """Representation of a single rule match."""
+# Interned token constants: the rewrite loops build and compare bullet,
+# dash, and small-number tokens constantly, so reuse single interned
+# objects instead of allocating a fresh string per occurrence.
+BULLET = sys.intern('•')
+DASH = sys.intern('-')
+_DIGIT_STRS = [sys.intern(str(i)) for i in range(10000)]
 
-    start: int
-    rule_id: int
-    tokens: List[str]
+
+def _digit_str(value: int) -> str:
+    """Return the decimal token for ``value``, interned when it is small."""
+    return _DIGIT_STRS[value] if 0 <= value < 10000 else str(value)
 
 
 # Normalize input to use centered bullets
@@ -38,13 +45,101 @@ def _normalize(chain: str) -> str:
 
 # Tokenization helpers
 def _tokenize(chain: str) -> List[str]:
-    """Split a chain into digits, bullet symbols, and dashes."""
-    return re.findall(r"\d+|[•-]", chain)
+    """Split a valid chain into digits, bullet symbols, and dashes.
+
+    The token language is regular and trivially delimiter-based, so instead
+    of dispatching into the backtracking ``re`` engine each step we pad the
+    two separator symbols with spaces and let ``str.split`` cut the digit
+    runs — three C-level passes with no per-character Python bytecode.
+    """
+    return chain.replace('•', ' • ').replace('-', ' - ').split()
+
+
+@dataclass(frozen=True)
+class LazyRepeat:
+    """A run of ``count`` copies of ``body`` stored as a single token.
+
+    Rule 4 replaces ``•(k+1)-v•n`` with ``n`` copies of ``•k-v``; for large
+    ``n`` materializing those copies up front is the sole source of
+    exponential list growth.  The copies are inert until the rewrite scan
+    actually reaches them, so they are kept as one compact record and the
+    scan unrolls a single trailing copy whenever it needs to look inside.
+    """
 
+    count: int
+    body: Tuple[str, ...]
 
-def _detokenize(tokens: List[str]) -> str:
+
+Token = Union[str, LazyRepeat]
+
+
+def _detokenize(tokens: List[Token]) -> str:
     """Convert a token list back into a chain string."""
-    return ''.join(tokens)
+    try:
+        # All-string lists — what the printing runners pass every step —
+        # join directly in C with no per-token Python loop.
+        return ''.join(tokens)
+    except TypeError:
+        parts = []
+        for t in tokens:
+            if type(t) is str:
+                parts.append(t)
+            else:
+                parts.append(''.join(t.body) * t.count)
+        return ''.join(parts)
+
+
+def _materialize(tokens: List[Token]) -> List[str]:
+    """Expand every LazyRepeat in a token list into plain string tokens.
+
+    Used by the runners whose tail inspection (or per-step printing) wants a
+    flat token list; :func:`run_last` skips this and keeps repeats packed.
+    """
+    if not any(type(t) is LazyRepeat for t in tokens):
+        return tokens
+    out: List[str] = []
+    for t in tokens:
+        if type(t) is str:
+            out.append(t)
+        else:
+            out.extend(list(t.body) * t.count)
+    return out
+
+
+# Token-kind codes: one byte per token, packed into a ``bytes`` array so the
+# rule scanners compare small integers instead of walking string objects.
+_K_REPEAT = 0  # a LazyRepeat record; matches no rule pattern directly
+_K_BULLET = 1
+_K_DASH = 2
+_K_ZERO = 3
+_K_DIGIT = 4  # any digit run other than a lone "0"
+
+_KIND_MAP = {BULLET: _K_BULLET, DASH: _K_DASH, _DIGIT_STRS[0]: _K_ZERO}
+
+
+def _token_kinds(tokens: List[Token]) -> bytes:
+    """Build the per-token kind array for a token list."""
+    kind_map = _KIND_MAP
+    return bytes(
+        (kind_map.get(t, _K_DIGIT) if type(t) is str else _K_REPEAT)
+        for t in tokens
+    )
+
+
+# Fixed-length rule patterns expressed over kind codes.  Because the kind
+# array is one byte per token, the rightmost occurrence of rule 1's
+# ``•0•m`` and rule 2's ``-0•`` can be located with bytes.rfind — a packed
+# word-at-a-time substring search in C — rather than checking every bullet
+# and dash index from Python.  Rule 1 needs two probes since the trailing
+# digit may or may not be a lone "0".
+_R1_PAT_Z = bytes((_K_BULLET, _K_ZERO, _K_BULLET, _K_ZERO))
+_R1_PAT_D = bytes((_K_BULLET, _K_ZERO, _K_BULLET, _K_DIGIT))
+_R2_PAT = bytes((_K_DASH, _K_ZERO, _K_BULLET))
+
+
+def _rfind_rule1(kinds: bytes, end: int) -> int:
+    """Rightmost index before ``end`` where rule 1's kind pattern occurs."""
+    return max(kinds.rfind(_R1_PAT_Z, 0, end), kinds.rfind(_R1_PAT_D, 0, end))
 
 
 MAX_DIGITS = 100
@@ -60,12 +155,76 @@ def _safe_int(token: str) -> Optional[int]:
         return None
 
 
-CHAIN_RE = re.compile(r'^[•.]\d+(?:[•-]\d+)*$')
+def is_valid_chain(chain: str) -> bool:
+    """Check whether the given chain has valid syntax.
+
+    Equivalent to fullmatching ``^•\\d+(?:[•-]\\d+)*$`` after
+    normalization, written as an explicit two-state scan: no regex-engine
+    dispatch, no match object, and the first invalid character bails out
+    early.
+    """
+    chain = _normalize(chain)
+    if not chain or chain[0] != '•':
+        return False
+    need_digit = True
+    for ch in chain[1:]:
+        if ch.isdecimal():
+            need_digit = False
+        elif ch == '•' or ch == '-':
+            if need_digit:
+                return False
+            need_digit = True
+        else:
+            return False
+    return not need_digit
+
+
+class _EscapeWatcher:
+    """Latches whether the user pressed the Escape key.
+
+    The non-interactive runners used to poll stdin with a zero-timeout
+    select() on every iteration — one syscall per rewrite step, which in
+    abridged runs can outweigh the step itself.  Instead, a single daemon
+    thread blocks on stdin and sets a flag; the hot loops read a plain
+    attribute.  When stdin is not a tty there is no keyboard, so the
+    thread is never started and the flag stays False for free.
+
+    The interactive runners keep polling via :func:`_escape_pressed`:
+    they read their step confirmations from stdin with input(), which a
+    watcher thread would race with.
+    """
+
+    def __init__(self) -> None:
+        self.pressed = False
+        self._started = False
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        if not sys.stdin.isatty():
+            return
+        threading.Thread(target=self._watch, daemon=True, name='escape-watcher').start()
+
+    def _watch(self) -> None:
+        try:
+            import msvcrt
+            while True:
+                if msvcrt.getch() == b'\x1b':
+                    self.pressed = True
+                    return
+        except ImportError:
+            pass
+        while True:
+            line = sys.stdin.readline()
+            if not line:  # EOF: nobody can press Escape any more
+                return
+            if line.strip() == '\x1b':
+                self.pressed = True
+                return
 
 
-def is_valid_chain(chain: str) -> bool:
-    """Check whether the given chain has valid syntax."""
-    return bool(CHAIN_RE.fullmatch(_normalize(chain)))
+_ESCAPE = _EscapeWatcher()
 
 
 def _escape_pressed() -> bool:
@@ -86,355 +245,489 @@ def _escape_pressed() -> bool:
     return False
 
 
-def _rule1(tokens: List[str]) -> List[RewriteMatch]:
-    """Match Rule 1: ``•0•m → •(m+1)``."""
-    n = len(tokens)
-    matches: List[RewriteMatch] = []
-    for i in range(n - 3):
-        if (
-            tokens[i] == '•'
-            and tokens[i + 1] == '0'
-            and tokens[i + 2] == '•'
-            and tokens[i + 3].isdigit()
-        ):
-            m_val = _safe_int(tokens[i + 3])
-            if m_val is None:
-                continue
-            new = tokens[:i] + ['•', str(m_val + 1)] + tokens[i + 4:]
-            matches.append(RewriteMatch(i, 1, new))
-    return matches
+def _try_rule1_at(tokens: List[Token], kinds: bytes, vals: List[Optional[int]], n: int, i: int) -> Optional[Tuple[List[Token], int]]:
+    """Try Rule 1 at index ``i``: ``•0•m → •(m+1)``.
 
+    On a match, return ``(replacement, end)`` where the rewrite replaces
+    ``tokens[i:end]`` with ``replacement``; the three other rule predicates
+    follow the same contract.
+    """
+    if i + 3 >= n:
+        return None
+    if not (
+        kinds[i] == _K_BULLET
+        and kinds[i + 1] == _K_ZERO
+        and kinds[i + 2] == _K_BULLET
+        and kinds[i + 3] >= _K_ZERO
+    ):
+        return None
+    m_val = vals[i + 3]
+    if m_val is None:
+        return None
+    return [BULLET, _digit_str(m_val + 1)], i + 4
 
-def _rule2(tokens: List[str]) -> List[RewriteMatch]:
-    """Match Rule 2: ``-0• → •``."""
-    n = len(tokens)
-    matches: List[RewriteMatch] = []
-    for i in range(n - 2):
-        if tokens[i] == '-' and tokens[i + 1] == '0' and tokens[i + 2] == '•':
-            new = tokens[:i] + ['•'] + tokens[i + 3:]
-            matches.append(RewriteMatch(i, 2, new))
-    return matches
 
+def _try_rule2_at(tokens: List[Token], kinds: bytes, vals: List[Optional[int]], n: int, i: int) -> Optional[Tuple[List[Token], int]]:
+    """Try Rule 2 at index ``i``: ``-0• → •``."""
+    if i + 2 >= n:
+        return None
+    if not (
+        kinds[i] == _K_DASH
+        and kinds[i + 1] == _K_ZERO
+        and kinds[i + 2] == _K_BULLET
+    ):
+        return None
+    return [BULLET], i + 3
 
-def _rule3(tokens: List[str]) -> List[RewriteMatch]:
-    """Match Rule 3 as described in the module summary."""
-    n = len(tokens)
-    matches: List[RewriteMatch] = []
-    for i in range(n):
-        if tokens[i] != '•':
+
+def _try_rule3_at(tokens: List[Token], kinds: bytes, vals: List[Optional[int]], bullets: List[int], n: int, i: int) -> Optional[Tuple[List[Token], int]]:
+    """Try Rule 3 at index ``i``, as described in the module summary."""
+    if kinds[i] != _K_BULLET:
+        return None
+    # A match needs at least one leading "0-" pair right after the anchor,
+    # so most anchors are rejected here without visiting any closing bullet.
+    if i + 2 >= n or kinds[i + 1] != _K_ZERO or kinds[i + 2] != _K_DASH:
+        return None
+    for j in bullets[bisect_right(bullets, i):]:
+        if j - i - 1 < 3:
             continue
-        for j in range(i + 1, n):
-            if tokens[j] != '•':
-                continue
-            inner = tokens[i + 1 : j]
-            if len(inner) < 3:
-                continue
-            zeros = 0
-            idx_inner = 0
-            while (
-                idx_inner + 1 < len(inner)
-                and inner[idx_inner] == '0'
-                and inner[idx_inner + 1] == '-'
-            ):
-                zeros += 1
-                idx_inner += 2
-            if zeros == 0:
-                continue
-            if idx_inner >= len(inner) or not inner[idx_inner].isdigit():
-                continue
-            kp1 = _safe_int(inner[idx_inner])
-            if kp1 is None:
-                continue
-            k = kp1 - 1
-            if j + 1 >= n or not tokens[j + 1].isdigit():
-                continue
-            n_val = _safe_int(tokens[j + 1])
-            if n_val is None:
-                continue
-            v_tokens = inner[idx_inner + 1 :]
-            valid_v = True
-            for t in range(0, len(v_tokens), 2):
-                if not (
-                    v_tokens[t] == '-' and t + 1 < len(v_tokens) and v_tokens[t + 1].isdigit()
-                ):
-                    valid_v = False
-                    break
-            if not valid_v:
-                continue
-            prefix = ['•', str(n_val)]
-            for _ in range(zeros - 1):
-                prefix += ['-', str(n_val)]
-            prefix += ['-', str(k)]
-            new = tokens[:i] + prefix + v_tokens + ['•', str(n_val)] + tokens[j + 2 :]
-            matches.append(RewriteMatch(i, 3, new))
-    return matches
+        zeros = 0
+        p = i + 1
+        while p + 1 < j and kinds[p] == _K_ZERO and kinds[p + 1] == _K_DASH:
+            zeros += 1
+            p += 2
+        if zeros == 0:
+            continue
+        if p >= j or kinds[p] < _K_ZERO:
+            continue
+        kp1 = vals[p]
+        if kp1 is None:
+            continue
+        k = kp1 - 1
+        if j + 1 >= n or kinds[j + 1] < _K_ZERO:
+            continue
+        n_val = vals[j + 1]
+        if n_val is None:
+            continue
+        valid_v = True
+        for t in range(p + 1, j, 2):
+            if not (kinds[t] == _K_DASH and t + 1 < j and kinds[t + 1] >= _K_ZERO):
+                valid_v = False
+                break
+        if not valid_v:
+            continue
+        n_tok = _digit_str(n_val)
+        prefix = [BULLET, n_tok] + [DASH, n_tok] * (zeros - 1) + [DASH, _digit_str(k)]
+        return prefix + tokens[p + 1 : j] + [BULLET, n_tok], j + 2
+    return None
+
+
+def _try_rule4_at(tokens: List[Token], kinds: bytes, vals: List[Optional[int]], n: int, i: int) -> Optional[Tuple[List[Token], int]]:
+    """Try Rule 4 at index ``i``, as described in the module summary."""
+    if i + 2 >= n:
+        return None
+    if not (kinds[i] == _K_BULLET and kinds[i + 1] >= _K_ZERO):
+        return None
+    k_val = vals[i + 1]
+    if k_val is None:
+        return None
+    k = k_val - 1
+    j = i + 2
+    while j + 1 < n and kinds[j] == _K_DASH and kinds[j + 1] >= _K_ZERO:
+        j += 2
+    if not (j + 1 < n and kinds[j] == _K_BULLET and kinds[j + 1] >= _K_ZERO):
+        return None
+    n_copies = vals[j + 1]
+    if n_copies is None:
+        return None
+    body = (BULLET, _digit_str(k)) + tuple(tokens[i + 2 : j])
+    if n_copies >= 2:
+        rep: List[Token] = [LazyRepeat(n_copies, body)]
+    else:
+        rep = list(body) * n_copies
+    return rep + [BULLET, _digit_str(n_copies)], j + 2
 
 
-def _rule4(tokens: List[str]) -> List[RewriteMatch]:
-    """Match Rule 4 as described in the module summary."""
+# Core rewrite function: smallest-suffix priority
+@lru_cache(maxsize=1 << 16)
+def _rewrite_tail(tail: Tuple[Token, ...]) -> Optional[Tuple[int, int, Tuple[Token, ...], bool]]:
+    """Find the rewrite within a chain tail, or return None if none matches.
+
+    Returns ``(start, end, replacement, stepped)`` describing the splice
+    ``tail[start:end] -> replacement``, so cached entries hold only the
+    delta rather than a full copy of the rewritten tail.  ``stepped`` is
+    False when the splice merely unrolls one copy out of a
+    :class:`LazyRepeat` the scan needed to look inside — a representation
+    change, not a rewrite step.
+
+    The scan order guarantees the selected match has the greatest start
+    index, with ties between rules at one index broken by rule number;
+    there is never a candidate set to reduce after the fact.
+    """
+    tokens = list(tail)
+    kinds = _token_kinds(tokens)
+    # One value-precompute pass so the predicates read vals[x] instead of
+    # re-running _safe_int on the same digit tokens at every candidate.
+    vals = [None if k < _K_ZERO else _safe_int(t) for t, k in zip(tokens, kinds)]
+    bullets = [p for p in range(len(tokens)) if kinds[p] == _K_BULLET]
     n = len(tokens)
-    matches: List[RewriteMatch] = []
-    for i in range(n - 2):
-        if tokens[i] == '•' and tokens[i + 1].isdigit():
-            k_val = _safe_int(tokens[i + 1])
-            if k_val is None:
+    r1 = _rfind_rule1(kinds, n)
+    r2 = kinds.rfind(_R2_PAT)
+    for i in range(n - 1, -1, -1):
+        # Dispatch on the kind code: rules 1, 3 and 4 start at a bullet
+        # (tried in priority order), rule 2 at a dash, and nothing starts at
+        # a digit, so most indices cost one integer compare and no calls.
+        # Rules 1 and 2 have fixed kind patterns, so their predicates only
+        # run at the pre-located rightmost occurrence.
+        kind = kinds[i]
+        if kind == _K_BULLET:
+            result = None
+            if i == r1:
+                result = _try_rule1_at(tokens, kinds, vals, n, i)
+                if result is None:  # oversized digit run; look further left
+                    r1 = _rfind_rule1(kinds, i + 3)
+            if result is None:
+                result = _try_rule3_at(tokens, kinds, vals, bullets, n, i) or _try_rule4_at(tokens, kinds, vals, n, i)
+        elif kind == _K_DASH:
+            if i != r2:
                 continue
-            k = k_val - 1
-            j = i + 2
-            v_tokens: List[str] = []
-            while j + 1 < n and tokens[j] == '-' and tokens[j + 1].isdigit():
-                v_tokens += [tokens[j], tokens[j + 1]]
-                j += 2
-            if j < n and tokens[j] == '•' and tokens[j + 1].isdigit():
-                n_copies = _safe_int(tokens[j + 1])
-                if n_copies is None:
-                    continue
-                rep: List[str] = []
-                for _ in range(n_copies):
-                    rep += ['•', str(k)] + v_tokens
-                new = tokens[:i] + rep + ['•', str(n_copies)] + tokens[j + 2 :]
-                matches.append(RewriteMatch(i, 4, new))
-    return matches
+            result = _try_rule2_at(tokens, kinds, vals, n, i)
+        elif kind == _K_REPEAT:
+            # Nothing matched to the right of this repeat, so the rightmost
+            # match (if any) needs to see into it: peel off one trailing copy
+            # and let the caller resume the search on the unrolled list.
+            rep = tokens[i]
+            if rep.count == 1:
+                expansion: Tuple[Token, ...] = rep.body
+            else:
+                expansion = (LazyRepeat(rep.count - 1, rep.body),) + rep.body
+            return i, i + 1, expansion, False
+        else:
+            continue
+        if result is not None:
+            replacement, end = result
+            return i, end, tuple(replacement), True
+    return None
+
+
+def rewrite_step_tokens(tokens: List[Token]) -> Optional[List[Token]]:
+    """Return the token list after applying one rewrite rule, if any."""
+    # The rules only inspect tokens at or to the right of their start index,
+    # so the rewrite of the whole chain is the prefix plus the rewrite of the
+    # shortest tail containing the rightmost match.  Trying tails cut at each
+    # bullet from the right keeps the memoized entries small and lets runs
+    # that revisit the same tail (rule 4 expansions do so constantly) reuse
+    # the cached result regardless of the prefix in front of it.
+    while True:
+        found = None
+        base = 0
+        for b in range(len(tokens) - 1, -1, -1):
+            if tokens[b] != BULLET:
+                continue
+            found = _rewrite_tail(tuple(tokens[b:]))
+            if found is not None:
+                base = b
+                break
+        if found is None:
+            # No tail starting at a bullet matched; a rule-2 match can still
+            # start at a dash before the first bullet.
+            found = _rewrite_tail(tuple(tokens))
+            if found is None:
+                return None
+        start, end, replacement, stepped = found
+        tokens = tokens[: base + start] + list(replacement) + tokens[base + end :]
+        if stepped:
+            return tokens
+        # A LazyRepeat was unrolled instead; keep searching the new list.
 
 
-# Core rewrite function: smallest-suffix priority
 def rewrite_step(chain: str) -> Optional[str]:
     """Return the next chain after applying one rewrite rule, if any."""
-    tokens = _tokenize(chain)
-    matches: List[RewriteMatch] = []
-    matches.extend(_rule1(tokens))
-    matches.extend(_rule2(tokens))
-    matches.extend(_rule3(tokens))
-    matches.extend(_rule4(tokens))
+    result = rewrite_step_tokens(_tokenize(chain))
+    return None if result is None else _detokenize(result)
 
-    if not matches:
-        return None
+# Standard runners
+_FLUSH_EVERY = 1024
+
+
+def _line_buffer() -> Tuple[List[str], int]:
+    """Output buffer plus flush interval for the streaming runners.
+
+    Piped output is batched and written in _FLUSH_EVERY-line chunks through
+    a single sys.stdout.write, avoiding per-line print overhead; on a tty
+    every line flushes immediately so progress stays visible.
+    """
+    return [], (1 if sys.stdout.isatty() else _FLUSH_EVERY)
 
-    max_i = max(m.start for m in matches)
-    candidates = [m for m in matches if m.start == max_i]
-    candidates.sort(key=lambda m: m.rule_id)
-    return _detokenize(candidates[0].tokens)
 
-# Standard runners
 def run_verbose(chain: str) -> None:
     """Print each intermediate chain produced during rewriting."""
 
-    cur = chain
-    print(cur)
+    tokens = _tokenize(chain)
+    buf, flush_every = _line_buffer()
+    append = buf.append
+    write = sys.stdout.write
+    append(chain + '\n')
     steps = 0
+    _ESCAPE.start()
     while True:
-        if _escape_pressed():
-            print("Escape pressed, exiting.")
+        if _ESCAPE.pressed:
+            append("Escape pressed, exiting.\n")
             break
-        nxt = rewrite_step(cur)
+        nxt = rewrite_step_tokens(tokens)
+        if nxt is not None:
+            nxt = _materialize(nxt)
         if nxt is None:
             break
-        print(nxt)
+        append(_detokenize(nxt) + '\n')
+        if len(buf) >= flush_every:
+            write(''.join(buf))
+            buf.clear()
         steps += 1
-        cur = nxt
-    print(f"Total steps: {steps}")
+        tokens = nxt
+    append(f"Total steps: {steps}\n")
+    write(''.join(buf))
 
 def run_last(chain: str) -> None:
     """Run until no rule applies and print only the final chain."""
 
-    cur = chain
+    tokens = _tokenize(chain)
     steps = 0
+    _ESCAPE.start()
     while True:
-        if _escape_pressed():
+        if _ESCAPE.pressed:
             print("Escape pressed, exiting.")
             return
-        nxt = rewrite_step(cur)
+        nxt = rewrite_step_tokens(tokens)
         if nxt is None:
-            print(cur)
+            print(_detokenize(tokens))
             print(f"Total steps: {steps}")
             return
         steps += 1
-        cur = nxt
+        tokens = nxt
 
 def run_interactive(chain: str) -> None:
     """Like :func:`run_verbose` but waits for input between steps."""
 
-    cur = chain
-    print(cur)
+    tokens = _tokenize(chain)
+    print(chain)
     steps = 0
     while True:
         if _escape_pressed():
             print("Escape pressed, exiting.")
             break
-        nxt = rewrite_step(cur)
+        nxt = rewrite_step_tokens(tokens)
+        if nxt is not None:
+            nxt = _materialize(nxt)
         if nxt is None:
             break
         resp = input()
         if resp == '\x1b':
             print("Escape pressed, exiting.")
             break
-        print(nxt)
+        print(_detokenize(nxt))
         steps += 1
-        cur = nxt
+        tokens = nxt
     print(f"Total steps: {steps}")
 
 
 # Abridged runners with streaming omissions and memoization
-def run_abridged(chain: str) -> None:
-    """Run with heuristics to omit large expansions while streaming output."""
-
-    cur = chain
-    print(cur)
-    steps = 0
-    local_cache: Dict[str, Tuple[str, int]] = {}
-    while True:
-        if _escape_pressed():
-            print("Escape pressed, exiting.")
-            break
-        old = cur
-        tokens = _tokenize(cur)
-        # trailing zeros
-        m = 0
-        idx = len(tokens) - 2
-        while idx-1 >= 0 and tokens[idx-1] == '0' and tokens[idx-2] == '•':
-            m += 1
-            idx -= 2
-        if m >= 5 and idx >= 0 and tokens[idx] == '•' and tokens[-1].isdigit():
-            n_val = _safe_int(tokens[-1])
-            if n_val is None:
-                break
-            new_chain = ''.join(tokens[:idx] + ['•', str(n_val + m)])
-            local_cache[old] = (new_chain, m)
-            print(f"({m} lines omitted)")
-            print(new_chain)
-            steps += m
-            cur = new_chain
-            continue
-        # suffix •1•n skip
-        if (len(tokens) >= 4 and tokens[-4] == '•' and tokens[-3] == '1' and
-                tokens[-2] == '•' and tokens[-1].isdigit()):
+class _StepCache:
+    """Bounded LRU memo of ``tokens -> (next_tokens, steps_skipped)``.
+
+    The abridged runners previously kept every chain they had ever seen in
+    a plain dict, which grows without bound on long runs and holds on to
+    multi-kilobyte token tuples that are never revisited.  An LRU with a
+    fixed entry cap keeps the recently-recurring tails that actually get
+    hit and lets stale entries fall out.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._data: "OrderedDict[Tuple[Token, ...], Tuple[List[Token], int]]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key: Tuple[Token, ...]) -> Optional[Tuple[List[Token], int]]:
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[Token, ...], value: Tuple[List[Token], int]) -> None:
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+
+def _classify_tail(tokens: List[str]) -> Optional[Tuple]:
+    """Decide in one backward pass which abridged shortcut applies.
+
+    Returns a tag tuple the abridged runners dispatch on:
+
+    * ``('zeros', idx, m, n_val)`` — ``m >= 5`` trailing ``•0`` pairs begin
+      at ``idx``; they collapse into ``•(n_val + m)`` in ``m`` steps;
+    * ``('one', skip, n_val)`` — a ``•1•n`` suffix collapsing to ``•2n``;
+    * ``('two', skip, result_val)`` — a ``•2•n`` suffix collapsing to
+      ``•(n * 2**n)``;
+    * ``('abort',)`` — a shortcut pattern whose count token is too large to
+      evaluate, so the runner should stop;
+    * ``None`` — no shortcut; take a normal rewrite step.
+    """
+    n = len(tokens)
+    if n < 4 or not tokens[-1].isdigit():
+        return None
+    # trailing zeros
+    m = 0
+    idx = n - 2
+    while idx - 1 >= 0 and tokens[idx - 1] == '0' and tokens[idx - 2] == BULLET:
+        m += 1
+        idx -= 2
+    if m >= 5 and tokens[idx] == BULLET:
+        n_val = _safe_int(tokens[-1])
+        if n_val is None:
+            return ('abort',)
+        return ('zeros', idx, m, n_val)
+    # suffix •1•n / •2•n
+    if tokens[-4] == BULLET and tokens[-2] == BULLET:
+        mid = tokens[-3]
+        if mid == '1':
             n_val = _safe_int(tokens[-1])
             if n_val is None:
-                break
+                return ('abort',)
             skip = n_val + 1
             if skip >= 5:
-                new_chain = ''.join(tokens[:-4] + ['•', str(2 * n_val)])
-                local_cache[old] = (new_chain, skip)
-                print(f"({skip} lines omitted)")
-                print(new_chain)
-                steps += skip
-                cur = new_chain
-                continue
-        # suffix •2•n skip (n*2^n + 1)
-        if (len(tokens) >= 4 and tokens[-4] == '•' and tokens[-3] == '2' and
-                tokens[-2] == '•' and tokens[-1].isdigit()):
+                return ('one', skip, n_val)
+        elif mid == '2':
             n_val = _safe_int(tokens[-1])
             if n_val is None:
-                break
-            skip = n_val * (2 ** n_val) + 1
+                return ('abort',)
+            result_val = n_val << n_val  # n * 2**n as a single shift
+            skip = result_val + 1
             if skip >= 5:
-                result_val = n_val * (2 ** n_val)
-                new_chain = ''.join(tokens[:-4] + ['•', str(result_val)])
-                local_cache[old] = (new_chain, skip)
-                print(f"({skip} lines omitted)")
-                print(new_chain)
-                steps += skip
-                cur = new_chain
-                continue
-        # previously cached
-        if cur in local_cache:
-            new_chain, skip = local_cache[cur]
-            print(f"({skip} lines omitted)")
-            print(new_chain)
-            steps += skip
-            cur = new_chain
-            continue
-        # normal step
-        nxt = rewrite_step(cur)
-        if nxt is None:
+                return ('two', skip, result_val)
+    return None
+
+
+def run_abridged(chain: str) -> None:
+    """Run with heuristics to omit large expansions while streaming output."""
+
+    tokens = _tokenize(chain)
+    buf, flush_every = _line_buffer()
+    append = buf.append
+    write = sys.stdout.write
+    append(chain + '\n')
+    steps = 0
+    local_cache = _StepCache()
+    _ESCAPE.start()
+    while True:
+        if _ESCAPE.pressed:
+            append("Escape pressed, exiting.\n")
             break
-        local_cache[old] = (nxt, 1)
-        print(nxt)
-        steps += 1
-        cur = nxt
-    print(f"Total steps: {steps}")
+        old = tuple(tokens)
+        # shortcut classification: one tail scan instead of three slice checks
+        tag = _classify_tail(tokens)
+        if tag is not None:
+            kind = tag[0]
+            if kind == 'abort':
+                break
+            if kind == 'zeros':
+                _, idx, skip, n_val = tag
+                new_tokens = tokens[:idx] + [BULLET, _digit_str(n_val + skip)]
+            elif kind == 'one':
+                _, skip, n_val = tag
+                new_tokens = tokens[:-4] + [BULLET, _digit_str(2 * n_val)]
+            else:  # 'two'
+                _, skip, result_val = tag
+                new_tokens = tokens[:-4] + [BULLET, _digit_str(result_val)]
+            local_cache.put(old, (new_tokens, skip))
+            append(f"({skip} lines omitted)\n")
+            append(_detokenize(new_tokens) + '\n')
+            steps += skip
+            tokens = new_tokens
+        else:
+            cached = local_cache.get(old)
+            if cached is not None:
+                # previously cached
+                new_tokens, skip = cached
+                append(f"({skip} lines omitted)\n")
+                append(_detokenize(new_tokens) + '\n')
+                steps += skip
+                tokens = new_tokens
+            else:
+                # normal step
+                nxt = rewrite_step_tokens(tokens)
+                if nxt is not None:
+                    nxt = _materialize(nxt)
+                if nxt is None:
+                    break
+                local_cache.put(old, (nxt, 1))
+                append(_detokenize(nxt) + '\n')
+                steps += 1
+                tokens = nxt
+        if len(buf) >= flush_every:
+            write(''.join(buf))
+            buf.clear()
+    append(f"Total steps: {steps}\n")
+    write(''.join(buf))
 
 
 def interactive_abridged(chain: str) -> None:
     """Interactive variant of :func:`run_abridged`."""
 
-    cur = chain
-    print(cur)
+    tokens = _tokenize(chain)
+    print(chain)
     steps = 0
-    local_cache: Dict[str, Tuple[str, int]] = {}
+    local_cache = _StepCache()
     while True:
         if _escape_pressed():
             print("Escape pressed, exiting.")
             break
-        old = cur
-        tokens = _tokenize(cur)
-        # trailing zeros
-        m = 0
-        idx = len(tokens) - 2
-        while idx-1 >= 0 and tokens[idx-1] == '0' and tokens[idx-2] == '•':
-            m += 1
-            idx -= 2
-        if m >= 5 and idx >= 0 and tokens[idx] == '•' and tokens[-1].isdigit():
-            n_val = _safe_int(tokens[-1])
-            if n_val is None:
+        old = tuple(tokens)
+        # shortcut classification: one tail scan instead of three slice checks
+        tag = _classify_tail(tokens)
+        if tag is not None:
+            kind = tag[0]
+            if kind == 'abort':
                 break
-            new_chain = ''.join(tokens[:idx] + ['•', str(n_val + m)])
-            local_cache[old] = (new_chain, m)
-            print(f"({m} lines omitted)")
-            print(new_chain)
-            steps += m
-            cur = new_chain
+            if kind == 'zeros':
+                _, idx, skip, n_val = tag
+                new_tokens = tokens[:idx] + [BULLET, _digit_str(n_val + skip)]
+            elif kind == 'one':
+                _, skip, n_val = tag
+                new_tokens = tokens[:-4] + [BULLET, _digit_str(2 * n_val)]
+            else:  # 'two'
+                _, skip, result_val = tag
+                new_tokens = tokens[:-4] + [BULLET, _digit_str(result_val)]
+            local_cache.put(old, (new_tokens, skip))
+            print(f"({skip} lines omitted)")
+            print(_detokenize(new_tokens))
+            steps += skip
+            tokens = new_tokens
             continue
-        # suffix •1•n
-        if (len(tokens) >= 4 and tokens[-4] == '•' and tokens[-3] == '1' and
-                tokens[-2] == '•' and tokens[-1].isdigit()):
-            n_val = _safe_int(tokens[-1])
-            if n_val is None:
-                break
-            skip = n_val + 1
-            if skip >= 5:
-                new_chain = ''.join(tokens[:-4] + ['•', str(2 * n_val)])
-                local_cache[old] = (new_chain, skip)
-                print(f"({skip} lines omitted)")
-                print(new_chain)
-                steps += skip
-                cur = new_chain
-                continue
-        # suffix •2•n
-        if (len(tokens) >= 4 and tokens[-4] == '•' and tokens[-3] == '2' and
-                tokens[-2] == '•' and tokens[-1].isdigit()):
-            n_val = _safe_int(tokens[-1])
-            if n_val is None:
-                break
-            skip = n_val * (2 ** n_val) + 1
-            if skip >= 5:
-                result_val = n_val * (2 ** n_val)
-                new_chain = ''.join(tokens[:-4] + ['•', str(result_val)])
-                local_cache[old] = (new_chain, skip)
-                print(f"({skip} lines omitted)")
-                print(new_chain)
-                steps += skip
-                cur = new_chain
-                continue
         # cached
-        if cur in local_cache:
-            new_chain, skip = local_cache[cur]
+        cached = local_cache.get(old)
+        if cached is not None:
+            new_tokens, skip = cached
             print(f"({skip} lines omitted)")
-            print(new_chain)
+            print(_detokenize(new_tokens))
             steps += skip
-            cur = new_chain
+            tokens = new_tokens
             continue
         # normal step
-        nxt = rewrite_step(cur)
+        nxt = rewrite_step_tokens(tokens)
+        if nxt is not None:
+            nxt = _materialize(nxt)
         if nxt is None:
             break
         resp = input()
         if resp == '\x1b':
             print("Escape pressed, exiting.")
             break
-        print(nxt)
+        print(_detokenize(nxt))
         steps += 1
-        cur = nxt
+        tokens = nxt
     print(f"Total steps: {steps}")
 
 # CLI interface